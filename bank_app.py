@@ -1,22 +1,24 @@
-import sys
-import uuid
 import datetime
-from PySide6.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QPushButton,
-    QTextEdit,
-    QMessageBox,
-    QComboBox,
-    QScrollArea,
-    QGridLayout,
-)
-from PySide6.QtGui import QFont
+import itertools
+
+_SEP = "-" * 30
+_NOW = datetime.datetime.now
+
+
+def _format_cents(cents):
+    """Formats an integer amount of cents as dollars, e.g. -1205 -> "-12.05"."""
+    sign = "-" if cents < 0 else ""
+    dollars, rem = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{rem:02d}"
+
+
+def _to_cents(amount, label):
+    """Converts a dollar amount to integer cents, raising ValueError if out of range."""
+    try:
+        return round(amount * 100)
+    except (OverflowError, ValueError):
+        # inf, NaN, or a finite amount whose cents overflow a float.
+        raise ValueError(f"{label} is out of range.") from None
 
 
 class BankAccount:
@@ -24,6 +26,21 @@ class BankAccount:
     Represents a single bank account.
     """
 
+    # Account numbers are sequential within a process; they only need to be
+    # unique among the accounts held in memory.
+    _next_id = itertools.count(1)
+
+    __slots__ = (
+        "account_number",
+        "account_holder_name",
+        "_cents",
+        "account_type",
+        "_ts",
+        "_types",
+        "_amounts",
+        "creation_date",
+    )
+
     def __init__(
         self, account_holder_name, initial_balance=0.0, account_type="Savings"
     ):
@@ -32,77 +49,172 @@ class BankAccount:
         """
         if not isinstance(initial_balance, (int, float)):
             raise TypeError("Initial balance must be a number.")
+        cents = _to_cents(initial_balance, "Initial balance")
         if initial_balance < 0:
             raise ValueError("Initial balance cannot be negative.")
 
-        self.account_number = str(uuid.uuid4())
+        self._init_fields(account_holder_name, cents, account_type)
+
+    @classmethod
+    def _unchecked(
+        cls, account_holder_name, initial_balance=0.0, account_type="Savings"
+    ):
+        """Creates an account from already-validated data (e.g. bulk import)."""
+        self = cls.__new__(cls)
+        self._init_fields(
+            account_holder_name, round(initial_balance * 100), account_type
+        )
+        return self
+
+    def _init_fields(self, account_holder_name, cents, account_type):
+        """Assigns the instance fields; cents is the opening balance in cents."""
+        # Money is held as integer cents; balance is exposed in dollars.
+        self._cents = cents
+        self.account_number = f"ACC{next(BankAccount._next_id):08d}"
         self.account_holder_name = account_holder_name
-        self.balance = initial_balance
         self.account_type = account_type
-        self.transactions = []
+        # Transaction history is kept as parallel lists (timestamps, types,
+        # amounts) rather than one dict per transaction.
+        self._ts = []
+        self._types = []
+        self._amounts = []
         self.creation_date = datetime.date.today()
 
     def deposit(self, amount):
         """Deposits money into the account."""
         if not isinstance(amount, (int, float)):
             raise TypeError("Deposit amount must be a number.")
-        if amount <= 0:
+        cents = _to_cents(amount, "Deposit amount")
+        if cents <= 0:
             raise ValueError("Deposit amount must be positive.")
 
-        self.balance += amount
-        self._add_transaction("Deposit", amount)
-        return f"Deposited ${amount:.2f}. New balance: ${self.balance:.2f}"
+        self._deposit_unchecked(cents)
+        return (
+            f"Deposited ${_format_cents(cents)}. "
+            f"New balance: ${_format_cents(self._cents)}"
+        )
 
     def withdraw(self, amount):
         """Withdraws money from the account."""
         if not isinstance(amount, (int, float)):
             raise TypeError("Withdrawal amount must be a number.")
-        if amount <= 0:
+        cents = _to_cents(amount, "Withdrawal amount")
+        if cents <= 0:
             raise ValueError("Withdrawal amount must be positive.")
-        if amount > self.balance:
+        if cents > self._cents:
             raise ValueError("Insufficient funds.")
 
-        self.balance -= amount
-        self._add_transaction("Withdrawal", -amount)
-        return f"Withdrew ${amount:.2f}. New balance: ${self.balance:.2f}"
+        self._withdraw_unchecked(cents)
+        return (
+            f"Withdrew ${_format_cents(cents)}. "
+            f"New balance: ${_format_cents(self._cents)}"
+        )
+
+    def _deposit_unchecked(self, cents):
+        """Deposits cents already validated by the caller (e.g. log replay)."""
+        self._cents += cents
+        self._add_transaction("Deposit", cents)
+
+    def _withdraw_unchecked(self, cents):
+        """Withdraws cents already validated by the caller (e.g. log replay)."""
+        self._cents -= cents
+        self._add_transaction("Withdrawal", -cents)
+
+    @property
+    def balance(self):
+        """The current balance in dollars."""
+        return self._cents / 100
+
+    @balance.setter
+    def balance(self, value):
+        self._cents = _to_cents(value, "Balance")
 
     def get_balance(self):
         """Returns the current balance of the account."""
         return self.balance
 
+    def get_formatted_balance(self):
+        """Returns the current balance formatted as dollars, e.g. "12.05"."""
+        return _format_cents(self._cents)
+
     def get_account_details(self):
         """Returns a string containing the account details."""
-        details = f"Account Number: {self.account_number}\n"
-        details += f"Account Holder: {self.account_holder_name}\n"
-        details += f"Account Type: {self.account_type}\n"
-        details += f"Balance: ${self.balance:.2f}\n"
-        details += f"Creation Date: {self.creation_date}\n"
-        return details
-
-    def _add_transaction(self, transaction_type, amount):
-        """Adds a transaction to the transaction history."""
-        timestamp = datetime.datetime.now()
-        self.transactions.append(
-            {"timestamp": timestamp, "type": transaction_type, "amount": amount}
+        return (
+            f"Account Number: {self.account_number}\n"
+            f"Account Holder: {self.account_holder_name}\n"
+            f"Account Type: {self.account_type}\n"
+            f"Balance: ${_format_cents(self._cents)}\n"
+            f"Creation Date: {self.creation_date}\n"
         )
 
+    def _add_transaction(self, transaction_type, cents):
+        """Adds a transaction (signed amount in cents) to the transaction history."""
+        timestamp = _NOW()
+        self._ts.append(timestamp)
+        self._types.append(transaction_type)
+        self._amounts.append(cents)
+
     def get_transaction_history(self):
         """Returns a list of all transactions."""
-        return self.transactions
+        return [
+            {"timestamp": timestamp, "type": transaction_type, "amount": cents / 100}
+            for timestamp, transaction_type, cents in zip(
+                self._ts, self._types, self._amounts
+            )
+        ]
+
+    def summary(self):
+        """
+        Returns statistics over the transaction history, in dollars.
+
+        "total" is the signed net of all deposits and withdrawals, "min" and
+        "max" are the smallest and largest signed transaction amounts, and
+        "lowest_balance"/"highest_balance" are the extremes of the running
+        balance, starting from the balance before the first transaction.
+        """
+        amounts = self._amounts
+        if not amounts:
+            balance = self._cents / 100
+            return {
+                "count": 0,
+                "total": 0.0,
+                "min": 0.0,
+                "max": 0.0,
+                "lowest_balance": balance,
+                "highest_balance": balance,
+            }
+        total = sum(amounts)
+        running = list(itertools.accumulate(amounts, initial=self._cents - total))
+        return {
+            "count": len(amounts),
+            "total": total / 100,
+            "min": min(amounts) / 100,
+            "max": max(amounts) / 100,
+            "lowest_balance": min(running) / 100,
+            "highest_balance": max(running) / 100,
+        }
+
+    @property
+    def transactions(self):
+        """Transaction history as a list of dicts (built on access)."""
+        return self.get_transaction_history()
 
     def format_transaction_history(self):
         """Formats transaction history for display."""
-        if not self.transactions:
+        if not self._ts:
             return "No transactions yet."
 
-        history_text = "-" * 30 + "\nTransaction History:\n" + "-" * 30 + "\n"
-        for transaction in self.transactions:
-            history_text += (
-                f"{transaction['timestamp'].strftime('%Y-%m-%d %H:%M:%S')} - "
-                f"{transaction['type']:<10}: ${transaction['amount']:>8.2f}\n"
+        parts = [_SEP, "Transaction History:", _SEP]
+        for t, transaction_type, cents in zip(self._ts, self._types, self._amounts):
+            # Built from the datetime fields directly; strftime re-parses
+            # its format string on every call.
+            parts.append(
+                f"{t.year}-{t.month:02}-{t.day:02} "
+                f"{t.hour:02}:{t.minute:02}:{t.second:02} - "
+                f"{transaction_type:<10}: ${_format_cents(cents):>8}"
             )
-        history_text += "-" * 30
-        return history_text
+        parts.append(_SEP)
+        return "\n".join(parts)
 
 
 class BankingSystem:
@@ -116,283 +228,49 @@ class BankingSystem:
     def create_account(
         self, account_holder_name, initial_balance=0.0, account_type="Savings"
     ):
-        """Creates a new bank account and adds it to the system."""
+        """
+        Creates a new bank account and adds it to the system.
+
+        Returns (True, account_number) on success, or (False, error_message).
+        """
         try:
             account = BankAccount(account_holder_name, initial_balance, account_type)
-            self.accounts[account.account_number] = account
-            return f"Account created successfully. Account number: {account.account_number}"
         except (TypeError, ValueError) as e:
-            return f"Account creation failed: {e}"
+            return False, str(e)
+        self.accounts[account.account_number] = account
+        return True, account.account_number
 
     def get_account(self, account_number):
         """Retrieves a bank account by its account number."""
         return self.accounts.get(account_number)
 
     def delete_account(self, account_number):
-        """Deletes a bank account from the system."""
-        if account_number in self.accounts:
-            del self.accounts[account_number]
-            return f"Account {account_number} deleted successfully."
-        else:
-            return f"Account {account_number} not found."
-
-    def list_all_accounts(self):
-        """Returns details for all accounts in the system as formatted text."""
-        if not self.accounts:
-            return "No accounts in the system."
-
-        accounts_text = "-" * 30 + "\nList of All Accounts:\n" + "-" * 30 + "\n"
-        for account_number, account in self.accounts.items():
-            accounts_text += account.get_account_details() + "-" * 30 + "\n"
-        return accounts_text
-
-
-class BankingApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Banking System")
-        self.setGeometry(100, 100, 800, 600)  # Adjusted window size
-        self.banking_system = BankingSystem()
-        self.init_ui()
-
-    def init_ui(self):
-        self.central_widget = QWidget(self)
-        self.setCentralWidget(self.central_widget)
-
-        self.layout = QVBoxLayout(self.central_widget)
-
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        self.title_label = QLabel("Welcome to the Banking System")
-        self.title_label.setFont(title_font)
-        self.layout.addWidget(self.title_label)
-
-        self.account_number_input = QLineEdit()
-        self.account_number_input.setPlaceholderText("Enter Account Number")
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("Account Holder Name")
-        self.balance_input = QLineEdit()
-        self.balance_input.setPlaceholderText("Initial Balance (optional)")
-        self.amount_input = QLineEdit()
-        self.amount_input.setPlaceholderText("Amount")
-        self.account_type_combo = QComboBox()
-        self.account_type_combo.addItems(["Savings", "Checking"])
-
-        self.output_display = QTextEdit()
-        self.output_display.setReadOnly(True)
-
-        # Create buttons with more descriptive text and tooltips
-        self.create_account_button = QPushButton("Create Account")
-        self.create_account_button.setToolTip("Create a new bank account")
-        self.deposit_button = QPushButton("Deposit")
-        self.deposit_button.setToolTip("Deposit money into an account")
-        self.withdraw_button = QPushButton("Withdraw")
-        self.withdraw_button.setToolTip("Withdraw money from an account")
-        self.check_balance_button = QPushButton("Check Balance")
-        self.check_balance_button.setToolTip("Check the balance of an account")
-        self.account_details_button = QPushButton("Account Details")
-        self.account_details_button.setToolTip("View details of an account")
-        self.transaction_history_button = QPushButton("Transaction History")
-        self.transaction_history_button.setToolTip("View transaction history of an account")
-        self.list_accounts_button = QPushButton("List All Accounts")
-        self.list_accounts_button.setToolTip("List all accounts in the system")
-        self.delete_account_button = QPushButton("Delete Account")
-        self.delete_account_button.setToolTip("Delete an existing account")
-        self.exit_button = QPushButton("Exit")
-        self.exit_button.setToolTip("Exit the application")
-
-        # Connect buttons to actions
-        self.create_account_button.clicked.connect(self.create_account)
-        self.deposit_button.clicked.connect(self.deposit)
-        self.withdraw_button.clicked.connect(self.withdraw)
-        self.check_balance_button.clicked.connect(self.check_balance)
-        self.account_details_button.clicked.connect(self.get_account_details)
-        self.transaction_history_button.clicked.connect(self.get_transaction_history)
-        self.list_accounts_button.clicked.connect(self.list_all_accounts)
-        self.delete_account_button.clicked.connect(self.delete_account)
-        self.exit_button.clicked.connect(self.close)
-
-        # Input Layout (using QGridLayout for better organization)
-        input_layout = QGridLayout()
-        input_layout.addWidget(QLabel("Account Number:"), 0, 0)
-        input_layout.addWidget(self.account_number_input, 0, 1)
-        input_layout.addWidget(QLabel("Account Holder Name:"), 1, 0)
-        input_layout.addWidget(self.name_input, 1, 1)
-        input_layout.addWidget(QLabel("Initial Balance:"), 2, 0)
-        input_layout.addWidget(self.balance_input, 2, 1)
-        input_layout.addWidget(QLabel("Account Type:"), 3, 0)
-        input_layout.addWidget(self.account_type_combo, 3, 1)
-        input_layout.addWidget(QLabel("Amount:"), 4, 0)
-        input_layout.addWidget(self.amount_input, 4, 1)
-
-        # Button Layout (using QHBoxLayout for horizontal arrangement)
-        button_layout1 = QHBoxLayout()
-        button_layout1.addWidget(self.create_account_button)
-        button_layout1.addWidget(self.deposit_button)
-        button_layout1.addWidget(self.withdraw_button)
-
-        button_layout2 = QHBoxLayout()
-        button_layout2.addWidget(self.check_balance_button)
-        button_layout2.addWidget(self.account_details_button)
-        button_layout2.addWidget(self.transaction_history_button)
-
-        button_layout3 = QHBoxLayout()
-        button_layout3.addWidget(self.list_accounts_button)
-        button_layout3.addWidget(self.delete_account_button)
-        button_layout3.addWidget(self.exit_button)
-
-
-        # Add layouts to main layout
-        self.layout.addLayout(input_layout)
-        self.layout.addLayout(button_layout1)
-        self.layout.addLayout(button_layout2)
-        self.layout.addLayout(button_layout3)
-        self.layout.addWidget(QLabel("Output:"))
-        self.scroll_area = QScrollArea()  # Wrap output in a scroll area
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.output_display)
-        self.layout.addWidget(self.scroll_area)
-
-
-    def display_message(self, message):
-        self.output_display.append(message + "\n")
-
-    def clear_output(self):
-        self.output_display.clear()
-
-    def get_account_number_input(self):
-        account_number = self.account_number_input.text()
-        if not account_number:
-            QMessageBox.warning(self, "Input Error", "Please enter an account number.")
-            return None
-        return account_number
-
-    def get_amount_input(self):
-        amount_text = self.amount_input.text()
-        if not amount_text:
-            QMessageBox.warning(self, "Input Error", "Please enter an amount.")
-            return None
-        try:
-            amount = float(amount_text)
-            return amount
-        except ValueError:
-            QMessageBox.warning(self, "Input Error", "Invalid amount. Please enter a number.")
-            return None
-
-    def create_account(self):
-        name = self.name_input.text()
-        initial_balance_text = self.balance_input.text()
-        account_type = self.account_type_combo.currentText()
-
-        if not name:
-            QMessageBox.warning(self, "Input Error", "Please enter account holder name.")
-            return
-
-        initial_balance = 0.0
-        if initial_balance_text:
-            try:
-                initial_balance = float(initial_balance_text)
-            except ValueError:
-                QMessageBox.warning(
-                    self, "Input Error", "Invalid initial balance. Please enter a number."
-                )
-                return
-
-        message = self.banking_system.create_account(name, initial_balance, account_type)
-        self.display_message(message)
-        if "successfully" in message: # Clear inputs only on successful account creation
-            self.name_input.clear()
-            self.balance_input.clear()
-            self.account_number_input.clear() # Clear account number input as it's usually generated
-
-
-    def deposit(self):
-        account_number = self.get_account_number_input()
-        amount = self.get_amount_input()
-        if not account_number or amount is None:
-            return
-
-        account = self.banking_system.get_account(account_number)
-        if account:
-            try:
-                message = account.deposit(amount)
-                self.display_message(message)
-                self.amount_input.clear() # Clear amount input after successful deposit
-            except (TypeError, ValueError) as e:
-                QMessageBox.warning(self, "Transaction Error", str(e))
-        else:
-            QMessageBox.warning(self, "Account Error", "Account not found.")
-
-    def withdraw(self):
-        account_number = self.get_account_number_input()
-        amount = self.get_amount_input()
-        if not account_number or amount is None:
-            return
-
-        account = self.banking_system.get_account(account_number)
-        if account:
-            try:
-                message = account.withdraw(amount)
-                self.display_message(message)
-                self.amount_input.clear() # Clear amount input after successful withdraw
-            except (TypeError, ValueError) as e:
-                QMessageBox.warning(self, "Transaction Error", str(e))
-        else:
-            QMessageBox.warning(self, "Account Error", "Account not found.")
-
-    def check_balance(self):
-        account_number = self.get_account_number_input()
-        if not account_number:
-            return
-
-        account = self.banking_system.get_account(account_number)
-        if account:
-            balance = account.get_balance()
-            self.display_message(f"Current balance: ${balance:.2f}")
-        else:
-            QMessageBox.warning(self, "Account Error", "Account not found.")
-
-    def get_account_details(self):
-        account_number = self.get_account_number_input()
-        if not account_number:
-            return
+        """
+        Deletes a bank account from the system.
 
-        account = self.banking_system.get_account(account_number)
-        if account:
-            details = account.get_account_details()
-            self.display_message(details)
-        else:
-            QMessageBox.warning(self, "Account Error", "Account not found.")
+        Returns True if it was deleted, or False if no such account exists.
+        """
+        return self.accounts.pop(account_number, None) is not None
 
-    def get_transaction_history(self):
-        account_number = self.get_account_number_input()
-        if not account_number:
+    def iter_account_details(self):
+        """Yields the text of list_all_accounts() in chunks, one account at a time."""
+        if not self.accounts:
+            yield "No accounts in the system."
             return
 
-        account = self.banking_system.get_account(account_number)
-        if account:
-            history_text = account.format_transaction_history()
-            self.display_message(history_text)
-        else:
-            QMessageBox.warning(self, "Account Error", "Account not found.")
+        sep_line = f"{_SEP}\n"
+        yield f"{_SEP}\nList of All Accounts:\n{sep_line}"
+        for account in self.accounts.values():
+            yield account.get_account_details()
+            yield sep_line
 
     def list_all_accounts(self):
-        accounts_text = self.banking_system.list_all_accounts()
-        self.display_message(accounts_text)
-
-    def delete_account(self):
-        account_number = self.get_account_number_input()
-        if not account_number:
-            return
-
-        message = self.banking_system.delete_account(account_number)
-        self.display_message(message)
-        self.account_number_input.clear() # Clear account number input after delete attempt
+        """Returns details for all accounts in the system as formatted text."""
+        return "".join(self.iter_account_details())
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    banking_app = BankingApp()
-    banking_app.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    # The GUI lives in bank_gui so importing the core classes does not load Qt.
+    from bank_gui import main
+
+    main()
@@ -0,0 +1,374 @@
+import math
+import re
+import sys
+from PySide6.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTextEdit,
+    QMessageBox,
+    QComboBox,
+    QScrollArea,
+    QGridLayout,
+)
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFont, QTextCursor
+
+from bank_app import BankingSystem
+
+# Plain decimal numbers, e.g. "12", "-3.5", ".75". Checked before float() so
+# invalid input is rejected without raising and catching ValueError.
+_AMOUNT_RE = re.compile(r"\s*-?(\d+(\.\d*)?|\.\d+)\s*")
+
+
+def _parse_amount(text):
+    """Returns text as a finite float, or None if it is not a valid amount."""
+    if not _AMOUNT_RE.fullmatch(text):
+        return None
+    # A long enough digit run still overflows to inf.
+    amount = float(text)
+    return amount if math.isfinite(amount) else None
+
+
+class BankingApp(QMainWindow):
+    # (attribute, text, tooltip, slot) for each button, grouped by row.
+    BUTTON_ROWS = (
+        (
+            (
+                "create_account_button",
+                "Create Account",
+                "Create a new bank account",
+                "create_account",
+            ),
+            (
+                "deposit_button",
+                "Deposit",
+                "Deposit money into an account",
+                "deposit",
+            ),
+            (
+                "withdraw_button",
+                "Withdraw",
+                "Withdraw money from an account",
+                "withdraw",
+            ),
+        ),
+        (
+            (
+                "check_balance_button",
+                "Check Balance",
+                "Check the balance of an account",
+                "check_balance",
+            ),
+            (
+                "account_details_button",
+                "Account Details",
+                "View details of an account",
+                "get_account_details",
+            ),
+            (
+                "transaction_history_button",
+                "Transaction History",
+                "View transaction history of an account",
+                "get_transaction_history",
+            ),
+        ),
+        (
+            (
+                "list_accounts_button",
+                "List All Accounts",
+                "List all accounts in the system",
+                "list_all_accounts",
+            ),
+            (
+                "delete_account_button",
+                "Delete Account",
+                "Delete an existing account",
+                "delete_account",
+            ),
+            (
+                "exit_button",
+                "Exit",
+                "Exit the application",
+                "close",
+            ),
+        ),
+    )
+
+    # Shared by every window; created on first use since a QFont needs a
+    # running QApplication.
+    _title_font = None
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Banking System")
+        self.setGeometry(100, 100, 800, 600)  # Adjusted window size
+        self.banking_system = BankingSystem()
+        self._out_buf = []
+        self.init_ui()
+
+    def init_ui(self):
+        self.central_widget = QWidget(self)
+        self.setCentralWidget(self.central_widget)
+
+        self.layout = QVBoxLayout(self.central_widget)
+
+        self.title_label = QLabel("Welcome to the Banking System")
+        self.title_label.setFont(self._get_title_font())
+        self.layout.addWidget(self.title_label)
+
+        self.account_number_input = QLineEdit()
+        self.account_number_input.setPlaceholderText("Enter Account Number")
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("Account Holder Name")
+        self.balance_input = QLineEdit()
+        self.balance_input.setPlaceholderText("Initial Balance (optional)")
+        self.amount_input = QLineEdit()
+        self.amount_input.setPlaceholderText("Amount")
+        self.account_type_combo = QComboBox()
+        self.account_type_combo.addItems(["Savings", "Checking"])
+
+        self.output_display = QTextEdit()
+        self.output_display.setReadOnly(True)
+
+        # One warning dialog, reused for every validation/lookup failure.
+        self._warn = QMessageBox(
+            QMessageBox.Warning, "", "", QMessageBox.Ok, self
+        )
+
+        # Input Layout (using QGridLayout for better organization)
+        input_layout = QGridLayout()
+        input_layout.addWidget(QLabel("Account Number:"), 0, 0)
+        input_layout.addWidget(self.account_number_input, 0, 1)
+        input_layout.addWidget(QLabel("Account Holder Name:"), 1, 0)
+        input_layout.addWidget(self.name_input, 1, 1)
+        input_layout.addWidget(QLabel("Initial Balance:"), 2, 0)
+        input_layout.addWidget(self.balance_input, 2, 1)
+        input_layout.addWidget(QLabel("Account Type:"), 3, 0)
+        input_layout.addWidget(self.account_type_combo, 3, 1)
+        input_layout.addWidget(QLabel("Amount:"), 4, 0)
+        input_layout.addWidget(self.amount_input, 4, 1)
+
+        # Button rows (using QHBoxLayout for horizontal arrangement), built
+        # from BUTTON_ROWS; each button is also kept as self.<attr>.
+        button_layouts = []
+        for row in self.BUTTON_ROWS:
+            button_layout = QHBoxLayout()
+            for attr, text, tooltip, slot in row:
+                button = QPushButton(text)
+                button.setToolTip(tooltip)
+                button.clicked.connect(getattr(self, slot))
+                setattr(self, attr, button)
+                button_layout.addWidget(button)
+            button_layouts.append(button_layout)
+
+        # Add layouts to main layout
+        self.layout.addLayout(input_layout)
+        for button_layout in button_layouts:
+            self.layout.addLayout(button_layout)
+        self.layout.addWidget(QLabel("Output:"))
+        self.scroll_area = QScrollArea()  # Wrap output in a scroll area
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setWidget(self.output_display)
+        self.layout.addWidget(self.scroll_area)
+
+
+    @classmethod
+    def _get_title_font(cls):
+        if cls._title_font is None:
+            cls._title_font = QFont()
+            cls._title_font.setPointSize(18)
+            cls._title_font.setBold(True)
+        return cls._title_font
+
+    def show_warning(self, title, message):
+        self._warn.setWindowTitle(title)
+        self._warn.setText(message)
+        self._warn.exec()
+
+    def display_message(self, message):
+        # Messages are buffered and written to the output in one insert once
+        # control returns to the event loop, instead of one append per call.
+        if not self._out_buf:
+            QTimer.singleShot(0, self.flush_output)
+        self._out_buf.append(message)
+
+    def flush_output(self):
+        if not self._out_buf:
+            return
+        text = "\n\n".join(self._out_buf) + "\n"
+        self._out_buf.clear()
+        if not self.output_display.document().isEmpty():
+            text = "\n" + text
+        self.output_display.moveCursor(QTextCursor.End)
+        self.output_display.insertPlainText(text)
+        self.output_display.ensureCursorVisible()
+
+    def clear_output(self):
+        self._out_buf.clear()
+        self.output_display.clear()
+
+    def get_account_number_input(self):
+        account_number = self.account_number_input.text()
+        if not account_number:
+            self.show_warning("Input Error", "Please enter an account number.")
+            return None
+        return account_number
+
+    def get_amount_input(self):
+        amount_text = self.amount_input.text()
+        if not amount_text:
+            self.show_warning("Input Error", "Please enter an amount.")
+            return None
+        amount = _parse_amount(amount_text)
+        if amount is None:
+            self.show_warning("Input Error", "Invalid amount. Please enter a number.")
+        return amount
+
+    def create_account(self):
+        name = self.name_input.text()
+        initial_balance_text = self.balance_input.text()
+        account_type = self.account_type_combo.currentText()
+
+        if not name:
+            self.show_warning("Input Error", "Please enter account holder name.")
+            return
+
+        initial_balance = 0.0
+        if initial_balance_text:
+            initial_balance = _parse_amount(initial_balance_text)
+            if initial_balance is None:
+                self.show_warning(
+                    "Input Error", "Invalid initial balance. Please enter a number."
+                )
+                return
+
+        ok, payload = self.banking_system.create_account(
+            name, initial_balance, account_type
+        )
+        if ok: # Clear inputs only on successful account creation
+            self.display_message(
+                f"Account created successfully. Account number: {payload}"
+            )
+            self.name_input.clear()
+            self.balance_input.clear()
+            self.account_number_input.clear() # Clear account number input as it's usually generated
+        else:
+            self.display_message(f"Account creation failed: {payload}")
+
+
+    def deposit(self):
+        account_number = self.get_account_number_input()
+        amount = self.get_amount_input()
+        if not account_number or amount is None:
+            return
+
+        account = self.banking_system.get_account(account_number)
+        if account:
+            try:
+                message = account.deposit(amount)
+                self.display_message(message)
+                self.amount_input.clear() # Clear amount input after successful deposit
+            except (TypeError, ValueError) as e:
+                self.show_warning("Transaction Error", str(e))
+        else:
+            self.show_warning("Account Error", "Account not found.")
+
+    def withdraw(self):
+        account_number = self.get_account_number_input()
+        amount = self.get_amount_input()
+        if not account_number or amount is None:
+            return
+
+        account = self.banking_system.get_account(account_number)
+        if account:
+            try:
+                message = account.withdraw(amount)
+                self.display_message(message)
+                self.amount_input.clear() # Clear amount input after successful withdraw
+            except (TypeError, ValueError) as e:
+                self.show_warning("Transaction Error", str(e))
+        else:
+            self.show_warning("Account Error", "Account not found.")
+
+    def check_balance(self):
+        account_number = self.get_account_number_input()
+        if not account_number:
+            return
+
+        account = self.banking_system.get_account(account_number)
+        if account:
+            balance = account.get_formatted_balance()
+            self.display_message(f"Current balance: ${balance}")
+        else:
+            self.show_warning("Account Error", "Account not found.")
+
+    def get_account_details(self):
+        account_number = self.get_account_number_input()
+        if not account_number:
+            return
+
+        account = self.banking_system.get_account(account_number)
+        if account:
+            details = account.get_account_details()
+            self.display_message(details)
+        else:
+            self.show_warning("Account Error", "Account not found.")
+
+    def get_transaction_history(self):
+        account_number = self.get_account_number_input()
+        if not account_number:
+            return
+
+        account = self.banking_system.get_account(account_number)
+        if account:
+            history_text = account.format_transaction_history()
+            self.display_message(history_text)
+        else:
+            self.show_warning("Account Error", "Account not found.")
+
+    def list_all_accounts(self):
+        # Stream the listing into the output chunk by chunk without joining
+        # it first. The inserts share one edit block, so the document is laid
+        # out once for the whole listing. Pending messages are flushed first
+        # to keep the output in order.
+        self.flush_output()
+        document = self.output_display.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not document.isEmpty():
+            cursor.insertText("\n")
+        for chunk in self.banking_system.iter_account_details():
+            cursor.insertText(chunk)
+        cursor.insertText("\n")
+        cursor.endEditBlock()
+        self.output_display.setTextCursor(cursor)
+        self.output_display.ensureCursorVisible()
+
+    def delete_account(self):
+        account_number = self.get_account_number_input()
+        if not account_number:
+            return
+
+        if self.banking_system.delete_account(account_number):
+            self.display_message(f"Account {account_number} deleted successfully.")
+        else:
+            self.display_message(f"Account {account_number} not found.")
+        self.account_number_input.clear() # Clear account number input after delete attempt
+
+
+def main():
+    app = QApplication(sys.argv)
+    banking_app = BankingApp()
+    banking_app.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()